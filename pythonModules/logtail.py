@@ -6,6 +6,9 @@ with the `log-tail.hacolby.workers.dev` log service.
 
 Features:
 -   Convenience methods for logging (info, error, warn).
+-   Non-blocking log calls: entries are queued and shipped in batches
+    by a background thread (call `flush()` to wait for delivery, and
+    `close()` to flush and stop the thread).
 -   Batch log ingestion.
 -   Log searching and AI analysis.
 -   **Conditional Authentication:**
@@ -14,14 +17,103 @@ Features:
     -   Search and Analysis endpoints (`/api/v1/logs/search`,
         `/api/v1/ai-analysis`) are secure and automatically send the
         `Authorization` header.
+-   `AsyncCloudflareLogger`, an `asyncio` variant built on `httpx` that
+    multiplexes concurrent requests over a single HTTP/2 connection.
 """
 import os
+import sys
+import asyncio
+import atexit
+import queue
+import threading
+import time
 import requests
 import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, List, Dict, Any, Iterator, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    import httpx
+except ImportError:  # httpx is only required for AsyncCloudflareLogger
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # ijson is only required for iter_search_logs
+    ijson = None
+
+# Request bodies are serialized with orjson; these options also let metadata
+# carry non-string dict keys and naive (UTC) datetimes.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+# Large batches are split into requests of at most this many entries so a
+# single body stays well under the Worker's request size limit.
+_BATCH_CHUNK_SIZE = 1000
+
+# Every API path this client calls
+_ENDPOINT_PATHS = (
+    '/api/v1/logs/ingest',
+    '/api/v1/logs/ingest/batch',
+    '/api/v1/logs/search',
+    '/api/v1/ai-analysis',
+)
+
+# Numeric severities used for the client-side minimum level gate. Levels not
+# listed here are never filtered out.
+_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARN': 30, 'WARNING': 30, 'ERROR': 40}
+
+# Longest the interpreter waits at exit for queued entries to be delivered,
+# so an unreachable log service can't hold up shutdown.
+_EXIT_FLUSH_TIMEOUT = 5.0
+
+# Queued in place of an entry to tell the background thread to stop.
+_STOP = None
+
+
+def _write_error(message: str):
+    """
+    Reports a client-side error on stderr with a single write call, so
+    threads logging concurrently don't contend on stdout or interleave lines.
+    """
+    sys.stderr.write(message + '\n')
+
+
+def _search_params(
+    service: Optional[str] = None,
+    level: Optional[str] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    limit: int = 100,
+    offset: Optional[int] = None,
+    query: Optional[str] = None
+) -> Dict[str, Any]:
+    """Builds the search query string parameters, omitting unset filters."""
+    # Only set values go in, so None never reaches the query string and no
+    # intermediate dict has to be filtered afterwards
+    params: Dict[str, Any] = {}
+    if service is not None:
+        params['service'] = service
+    if level is not None:
+        params['level'] = level
+    if start_time is not None:
+        params['start_time'] = start_time
+    if end_time is not None:
+        params['end_time'] = end_time
+    if limit is not None:
+        params['limit'] = limit
+    if offset is not None:
+        params['offset'] = offset
+    if query is not None:
+        params['query'] = query
+    return params
+
+
 class CloudflareLogger:
     """
     A Python client for the Cloudflare Log Service.
@@ -29,8 +121,33 @@ class CloudflareLogger:
     Manages sending logs, searching logs, and running AI analysis,
     applying authentication only when required.
     """
-    
-    def __init__(self, service_name: str, api_key: str):
+
+    # No per-instance __dict__: smaller instances and faster attribute access
+    # on the hot log() path. New attributes must be listed here.
+    __slots__ = (
+        'service_name',
+        'api_key',
+        '_on_error',
+        'min_level_num',
+        '_headers_public',
+        '_headers_auth',
+        'session',
+        'base_url',
+        '_urls',
+        '_q',
+        '_flush_interval',
+        '_max_batch',
+        '_drain_thread',
+        '_executor',
+    )
+
+    def __init__(
+        self,
+        service_name: str,
+        api_key: str,
+        min_level: Optional[str] = None,
+        on_error: Optional[Callable[[Exception, str], None]] = None
+    ):
         """
         Initializes the logger client.
 
@@ -40,11 +157,68 @@ class CloudflareLogger:
             api_key (str): The secret API key. This is *only* used for
                            secure endpoints (search, analysis) and is
                            *not* sent during log ingestion.
+            min_level (str, optional): Entries below this level are dropped
+                                       before any work is done. Defaults to
+                                       `LOGTAIL_MIN_LEVEL`, else 'INFO'.
+            on_error (Callable, optional): Called as `on_error(exc, url)`
+                                           when a request fails, instead
+                                           of writing the error to stderr.
         """
         self.service_name = service_name
         self.api_key = api_key
+        self._on_error = on_error
+
+        min_level = (min_level or os.getenv('LOGTAIL_MIN_LEVEL', 'INFO')).upper()
+        if min_level not in _LEVELS:
+            raise ValueError(f"Unknown log level: {min_level}")
+        self.min_level_num = _LEVELS[min_level]
+
+        # Header sets are built once; the HTTP client copies them per request
+        self._headers_public = {'Content-Type': 'application/json'}
+        self._headers_auth = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {api_key}'
+        }
         self.session = requests.Session()
         self.base_url = "https://log-tail.hacolby.workers.dev"
+        # The set of endpoints is fixed, so resolve their full URLs once
+        self._urls = {path: self._endpoint_url(path) for path in _ENDPOINT_PATHS}
+
+        # Every request goes to the same host, so keep a larger pool of warm
+        # TLS connections around instead of urllib3's default of 10, which
+        # forces a fresh handshake whenever concurrent callers exceed it.
+        # Transient failures are retried with jittered exponential backoff
+        # (honouring Retry-After) so many clients don't retry in lockstep.
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=4,
+                backoff_factor=0.5,
+                backoff_jitter=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                allowed_methods=frozenset(['GET', 'POST'])
+            )
+        )
+        self.session.mount('https://', adapter)
+
+        # log() only enqueues; a daemon thread drains the queue and ships
+        # entries to the batch endpoint every 200ms or 500 records.
+        self._q: "queue.Queue[Tuple[str, str, bytes]]" = queue.Queue(maxsize=10000)
+        self._flush_interval = 0.2
+        self._max_batch = 500
+        self._drain_thread = threading.Thread(
+            target=self._drain,
+            name='cloudflare-logger',
+            daemon=True
+        )
+        self._drain_thread.start()
+        atexit.register(self._flush_at_exit)
+
+        # Runs many secure calls in parallel over the pooled session; kept
+        # well under pool_maxsize so workers never wait on a connection slot.
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='cflog')
 
     def _endpoint_url(self, uri: str) -> str:
         """
@@ -61,85 +235,259 @@ class CloudflareLogger:
         clean_uri = uri.lstrip('/')
         return f"{clean_base}/{clean_uri}"
 
+    def _report_error(self, exc: Exception, url: str, message: str):
+        """Hands a failed request to `on_error`, or writes it to stderr."""
+        if self._on_error is not None:
+            self._on_error(exc, url)
+        else:
+            _write_error(message)
+
+    def _report_call_error(self, exc: Exception, path: str, message: str):
+        """
+        Reports an error caught around a `_request` call. Request failures
+        were already reported by `_request` itself, so only other errors
+        (e.g. a malformed response body) are passed on here.
+        """
+        if not isinstance(exc, requests.exceptions.RequestException):
+            self._report_error(exc, self._urls[path], message)
+
     def _request(
         self,
         method: str,
         path: str,
+        *,
+        auth: bool,
         json_payload: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
         params: Optional[Dict[str, Any]] = None,
-        timeout: int = 10
+        timeout: int = 10,
+        stream: bool = False
     ) -> requests.Response:
         """
         A centralized helper for making API requests to the main log service.
         
         **Conditional Authentication:**
-        This function automatically attaches the `Authorization` header
-        *only* for non-ingestion endpoints (e.g., search, analysis).
-        Ingestion endpoints are treated as public and do not send the key.
+        The `Authorization` header is attached *only* when `auth` is True,
+        which callers set for secure endpoints (e.g., search, analysis).
+        Ingestion endpoints are public and pass `auth=False`.
+
+        `body` sends an already-encoded JSON body in place of `json_payload`.
+        With `stream=True` the body is left unread; the caller must consume
+        and close the response.
         """
-        full_url = self._endpoint_url(path)
+        full_url = self._urls[path]
         
-        headers = {
-            'Content-Type': 'application/json'
-        }
-
         # --- Conditional Authentication Logic ---
-        # Only add the API key if the path is NOT for ingestion.
-        is_ingestion = path.startswith('/api/v1/logs/ingest')
-        if not is_ingestion:
-            headers['Authorization'] = f'Bearer {self.api_key}'
+        # Only send the API key for secure (non-ingestion) endpoints.
+        headers = self._headers_auth if auth else self._headers_public
         # ----------------------------------------
 
+        if json_payload is not None:
+            body = orjson.dumps(json_payload, option=_ORJSON_OPTIONS)
+
         try:
             response = self.session.request(
                 method=method,
                 url=full_url,
                 headers=headers,
-                json=json_payload,
+                data=body,
                 params=params,
-                timeout=timeout
+                timeout=timeout,
+                stream=stream
             )
             # Raise an HTTPError for bad responses (4xx or 5xx)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as http_err:
-            print(f"[HTTP Error] {http_err.response.status_code} for {full_url}: {http_err.response.text}")
+            self._report_error(http_err, full_url, f"[HTTP Error] {http_err.response.status_code} for {full_url}: {http_err.response.text}")
             raise
         except requests.exceptions.ConnectionError as conn_err:
-            print(f"[Connection Error] Failed to connect to {full_url}: {conn_err}")
+            self._report_error(conn_err, full_url, f"[Connection Error] Failed to connect to {full_url}: {conn_err}")
             raise
         except requests.exceptions.Timeout as timeout_err:
-            print(f"[Timeout Error] Request to {full_url} timed out: {timeout_err}")
+            self._report_error(timeout_err, full_url, f"[Timeout Error] Request to {full_url} timed out: {timeout_err}")
             raise
         except requests.exceptions.RequestException as req_err:
-            print(f"[Request Error] An error occurred: {req_err}")
+            self._report_error(req_err, full_url, f"[Request Error] An error occurred: {req_err}")
             raise
 
     def log(self, level: str, message: str, **metadata):
         """
-        Sends a single log entry to the (public) ingestion endpoint.
+        Queues a single log entry for the (public) batch ingestion endpoint.
+
+        Returns immediately; the background thread delivers the entry.
+        """
+        lvl = level.upper()
+        self._log_fast(_LEVELS.get(lvl, self.min_level_num), lvl, message, metadata)
+
+    def _log_fast(self, lvl_num: int, lvl: str, message: str, metadata: Dict[str, Any]):
         """
+        Core of `log()` for an already-resolved level. The convenience
+        methods call this directly with constant levels, skipping the
+        upper-casing and table lookup.
+        """
+        if lvl_num < self.min_level_num:
+            return
+
+        now_ms = time.time_ns() // 1_000_000 # UTC ms
         payload = {
             'service_name': self.service_name,
-            'level': level.upper(),
+            'level': lvl,
             'message': message,
-            'timestamp': int(datetime.utcnow().timestamp() * 1000), # UTC ms
+            'timestamp': now_ms,
             'metadata': {
                 **metadata,
-                'timestamp_iso': datetime.utcnow().isoformat()
+                'timestamp_iso': datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc).isoformat()
             }
         }
-        
+
+        # Encode on the caller's thread: an entry that can't be serialized is
+        # rejected here instead of failing the whole batch it would join, and
+        # later changes to the caller's metadata objects can't leak into it
         try:
-            self._request(
-                'POST',
-                '/api/v1/logs/ingest',
-                json_payload=payload,
-                timeout=5
-            )
-        except Exception as e:
-            # Fallback to local print if service is unavailable
-            print(f"[LOG ERROR] {e}: {message}")
+            entry = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError as e:
+            _write_error(f"[LOG ERROR] Cannot serialize log entry, dropping: {message} ({e})")
+            return
+
+        try:
+            self._q.put_nowait((lvl, message, entry))
+        except queue.Full:
+            # Best effort: drop the entry rather than block the caller
+            _write_error(f"[LOG ERROR] Log queue full, dropping: {message}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every queued log entry has been sent (or has failed),
+        or until `timeout` seconds have passed.
+
+        Returns:
+            bool: False if the timeout expired with entries still pending.
+        """
+        if timeout is None:
+            self._q.join()
+            return True
+
+        deadline = time.monotonic() + timeout
+        with self._q.all_tasks_done:
+            while self._q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._q.all_tasks_done.wait(remaining)
+        return True
+
+    def _flush_at_exit(self):
+        """Bounded flush registered with `atexit`."""
+        if not self.flush(_EXIT_FLUSH_TIMEOUT):
+            _write_error("[LOG ERROR] Timed out delivering queued log entries at exit")
+
+    def close(self, timeout: Optional[float] = _EXIT_FLUSH_TIMEOUT):
+        """
+        Flushes queued entries (waiting at most `timeout` seconds), then
+        stops the background thread, shuts down the worker pool and closes
+        the HTTP session. The logger must not be used afterwards.
+        """
+        atexit.unregister(self._flush_at_exit)
+        self.flush(timeout)
+
+        try:
+            self._q.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass  # Still backed up; the daemon thread dies with the process
+        else:
+            self._drain_thread.join(timeout)
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def __enter__(self) -> "CloudflareLogger":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _drain(self):
+        """
+        Background worker: collects queued entries into batches of up to
+        `_max_batch` records or `_flush_interval` seconds, then sends each
+        batch in a single request. Repeated messages within a batch are
+        coalesced first (see `_coalesce`).
+        """
+        stopping = False
+        while not stopping:
+            item = self._q.get()
+            if item is _STOP:
+                self._q.task_done()
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    # Send what was collected, then stop (see close())
+                    self._q.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                self._send_batch(self._coalesce(batch))
+            finally:
+                for _ in batch:
+                    self._q.task_done()
+
+    @staticmethod
+    def _coalesce(batch: List[Tuple[str, str, bytes]]) -> List[bytes]:
+        """
+        Collapses queued `(level, message, entry)` items sharing the same
+        (level, message) into the most recent entry, recording how many were
+        seen in `metadata['occurrences']`. Order follows each key's first
+        appearance. Returns the encoded entries.
+        """
+        latest: Dict[Tuple[str, str], bytes] = {}
+        counts: Counter = Counter()
+        for lvl, message, entry in batch:
+            key = (lvl, message)
+            counts[key] += 1
+            latest[key] = entry
+
+        if len(latest) == len(batch):
+            return [entry for _, _, entry in batch]
+
+        for key, entry in latest.items():
+            if counts[key] > 1:
+                payload = orjson.loads(entry)
+                payload['metadata']['occurrences'] = counts[key]
+                latest[key] = orjson.dumps(payload)
+        return list(latest.values())
+
+    def _send_batch(self, entries: List[bytes]):
+        """
+        Posts already-encoded log entries to the (public) batch endpoint,
+        in chunks of at most `_BATCH_CHUNK_SIZE` entries. A failed chunk
+        does not prevent the remaining chunks from being sent.
+        """
+        for start in range(0, len(entries), _BATCH_CHUNK_SIZE):
+            body = b'{"logs":[' + b','.join(entries[start:start + _BATCH_CHUNK_SIZE]) + b']}'
+
+            try:
+                self._request(
+                    'POST',
+                    '/api/v1/logs/ingest/batch',
+                    auth=False,
+                    body=body,
+                    timeout=10
+                )
+            except Exception as e:
+                self._report_call_error(e, '/api/v1/logs/ingest/batch', f"[BATCH LOG ERROR] {e}")
 
     def batch_log(self, logs: List[Dict[str, Any]]):
         """
@@ -149,46 +497,54 @@ class CloudflareLogger:
             logs (List[Dict]): A list of log dictionaries. Each dict
                                should have 'level', 'message', 'metadata'.
         """
+        # Loop invariants are hoisted out of the per-entry comprehension
+        svc = self.service_name
+        now_ms = time.time_ns() // 1_000_000 # UTC ms, shared by entries without one
         processed_logs = [
             {
-                'service_name': self.service_name,
-                'level': log['level'].upper(),
+                'service_name': svc,
+                'level': log['level'] if log['level'].isupper() else log['level'].upper(),
                 'message': log['message'],
-                'timestamp': log.get('timestamp', int(datetime.utcnow().timestamp() * 1000)),
-                'metadata': log.get('metadata', {})
+                'timestamp': log['timestamp'] if 'timestamp' in log else now_ms,
+                'metadata': log.get('metadata') or {}
             }
             for log in logs
         ]
-        
-        payload = {'logs': processed_logs}
-        
-        try:
-            self._request(
-                'POST',
-                '/api/v1/logs/ingest/batch',
-                json_payload=payload,
-                timeout=10
-            )
-        except Exception as e:
-            print(f"[BATCH LOG ERROR] {e}")
+
+        # Encode per entry so one unserializable entry is dropped on its own
+        entries = []
+        for payload in processed_logs:
+            try:
+                entries.append(orjson.dumps(payload, option=_ORJSON_OPTIONS))
+            except TypeError as e:
+                _write_error(f"[BATCH LOG ERROR] Cannot serialize log entry, dropping: {payload['message']} ({e})")
+
+        self._send_batch(entries)
+
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Returns True if an entry at `level` would be sent. Use it to skip
+        building expensive metadata for filtered-out levels.
+        """
+        return _LEVELS.get(level.upper(), self.min_level_num) >= self.min_level_num
 
     # --- Convenience Methods ---
 
     def info(self, message: str, **metadata):
         """Logs an INFO level message."""
-        self.log('INFO', message, **metadata)
+        self._log_fast(20, 'INFO', message, metadata)
     
     def error(self, message: str, **metadata):
         """Logs an ERROR level message."""
-        self.log('ERROR', message, **metadata)
+        self._log_fast(40, 'ERROR', message, metadata)
     
     def warning(self, message: str, **metadata):
         """Logs a WARN level message."""
-        self.log('WARN', message, **metadata)
+        self._log_fast(30, 'WARN', message, metadata)
         
     def debug(self, message: str, **metadata):
         """Logs a DEBUG level message."""
-        self.log('DEBUG', message, **metadata)
+        self._log_fast(10, 'DEBUG', message, metadata)
 
     # --- Secure Endpoints ---
 
@@ -219,29 +575,61 @@ class CloudflareLogger:
             Dict[str, Any]: The JSON response from the search API
                             (e.g., {'logs': [...], 'total': ...}).
         """
-        params = {
-            'service': service,
-            'level': level,
-            'start_time': start_time,
-            'end_time': end_time,
-            'limit': limit,
-            'offset': offset,
-            'query': query
-        }
-        # Remove None values so they aren't in the query string
-        clean_params = {k: v for k, v in params.items() if v is not None}
+        clean_params = _search_params(service, level, start_time, end_time, limit, offset, query)
         
         try:
             response = self._request(
                 'GET',
                 '/api/v1/logs/search',
+                auth=True,
                 params=clean_params
             )
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            print(f"[SEARCH ERROR] {e}")
+            self._report_call_error(e, '/api/v1/logs/search', f"[SEARCH ERROR] {e}")
             return {'logs': [], 'error': str(e)}
 
+    def iter_search_logs(
+        self,
+        service: Optional[str] = None,
+        level: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 100,
+        offset: Optional[int] = None,
+        query: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Like `search_logs`, but yields log entries one at a time while the
+        response is still streaming in, so large result sets are never
+        held in memory as a whole. Requires `ijson`.
+        This function calls a *secure* (auth-required) endpoint.
+
+        Yields:
+            Dict[str, Any]: Each entry of the response's `logs` array.
+        """
+        if ijson is None:
+            raise ImportError("iter_search_logs requires the 'ijson' package")
+
+        clean_params = _search_params(service, level, start_time, end_time, limit, offset, query)
+
+        try:
+            response = self._request(
+                'GET',
+                '/api/v1/logs/search',
+                auth=True,
+                params=clean_params,
+                stream=True
+            )
+        except Exception as e:
+            self._report_call_error(e, '/api/v1/logs/search', f"[SEARCH ERROR] {e}")
+            return
+
+        with response:
+            # Let urllib3 undo any gzip/deflate before ijson sees the bytes
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'logs.item')
+
     def analyze_logs(
         self,
         service: Optional[str] = None,
@@ -273,12 +661,343 @@ class CloudflareLogger:
             response = self._request(
                 'POST',
                 '/api/v1/ai-analysis',
+                auth=True,
+                json_payload=payload
+            )
+            result = orjson.loads(response.content)
+            return result.get('analysis', 'No analysis content returned.')
+        except Exception as e:
+            self._report_call_error(e, '/api/v1/ai-analysis', f"[ANALYSIS ERROR] {e}")
+            return f"Analysis failed: {e}"
+
+    def search_logs_many(self, param_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Runs several `search_logs` calls in parallel.
+
+        Args:
+            param_list (List[Dict]): One dict of `search_logs` keyword
+                                     arguments per search.
+
+        Returns:
+            List[Dict[str, Any]]: The search results, in the same order
+                                  as `param_list`.
+        """
+        return list(self._executor.map(lambda p: self.search_logs(**p), param_list))
+
+    def analyze_logs_many(self, param_list: List[Dict[str, Any]]) -> List[str]:
+        """
+        Runs several `analyze_logs` calls in parallel.
+
+        Args:
+            param_list (List[Dict]): One dict of `analyze_logs` keyword
+                                     arguments per analysis.
+
+        Returns:
+            List[str]: The analyses, in the same order as `param_list`.
+        """
+        return list(self._executor.map(lambda p: self.analyze_logs(**p), param_list))
+
+class AsyncCloudflareLogger:
+    """
+    An asyncio client for the Cloudflare Log Service.
+
+    Mirrors `CloudflareLogger`, but every network call is a coroutine so
+    many ingests/searches can be in flight on one event loop. Requires
+    `httpx[http2]`. Use as an async context manager, or call `close()`
+    when done.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        api_key: str,
+        min_level: Optional[str] = None,
+        on_error: Optional[Callable[[Exception, str], None]] = None
+    ):
+        """
+        Initializes the async logger client.
+
+        Args:
+            service_name (str): The name of the service logging. This will
+                                be attached to all log entries.
+            api_key (str): The secret API key. This is *only* used for
+                           secure endpoints (search, analysis) and is
+                           *not* sent during log ingestion.
+            min_level (str, optional): Entries below this level are dropped
+                                       before any work is done. Defaults to
+                                       `LOGTAIL_MIN_LEVEL`, else 'INFO'.
+            on_error (Callable, optional): Called as `on_error(exc, url)`
+                                           when a request fails, instead
+                                           of writing the error to stderr.
+        """
+        if httpx is None:
+            raise ImportError("AsyncCloudflareLogger requires the 'httpx[http2]' package")
+
+        self.service_name = service_name
+        self.api_key = api_key
+        self._on_error = on_error
+
+        min_level = (min_level or os.getenv('LOGTAIL_MIN_LEVEL', 'INFO')).upper()
+        if min_level not in _LEVELS:
+            raise ValueError(f"Unknown log level: {min_level}")
+        self.min_level_num = _LEVELS[min_level]
+
+        # Header sets are built once; the HTTP client copies them per request
+        self._headers_public = {'Content-Type': 'application/json'}
+        self._headers_auth = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {api_key}'
+        }
+        self.base_url = "https://log-tail.hacolby.workers.dev"
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    async def __aenter__(self) -> "AsyncCloudflareLogger":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """
+        Returns the shared HTTP/2 client, creating it on first use.
+
+        All traffic goes to a single host, so concurrent requests are
+        multiplexed as streams over one TCP+TLS connection.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                base_url=self.base_url,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            )
+        return self._client
+
+    async def close(self):
+        """Closes the underlying HTTP client and its pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    def _report_error(self, exc: Exception, url: str, message: str):
+        """Hands a failed request to `on_error`, or writes it to stderr."""
+        if self._on_error is not None:
+            self._on_error(exc, url)
+        else:
+            _write_error(message)
+
+    def _report_call_error(self, exc: Exception, path: str, message: str):
+        """Async counterpart of `CloudflareLogger._report_call_error`."""
+        if not isinstance(exc, httpx.HTTPError):
+            self._report_error(exc, f"{self.base_url}{path}", message)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        auth: bool,
+        json_payload: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: int = 10
+    ) -> "httpx.Response":
+        """
+        Async counterpart of `CloudflareLogger._request`.
+
+        Applies the same conditional authentication. The returned response
+        is fully read, so `response.content` is available directly.
+        """
+        # --- Conditional Authentication Logic ---
+        headers = self._headers_auth if auth else self._headers_public
+        # ----------------------------------------
+
+        full_url = f"{self.base_url}{path}"
+        body = orjson.dumps(json_payload, option=_ORJSON_OPTIONS) if json_payload is not None else None
+
+        try:
+            response = await self._get_client().request(
+                method,
+                path,
+                content=body,
+                params=params,
+                headers=headers,
+                timeout=timeout
+            )
+            # Raise an HTTPStatusError for bad responses (4xx or 5xx)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as http_err:
+            self._report_error(http_err, full_url, f"[HTTP Error] {http_err.response.status_code} for {full_url}: {http_err.response.text}")
+            raise
+        except httpx.TimeoutException as timeout_err:
+            self._report_error(timeout_err, full_url, f"[Timeout Error] Request to {full_url} timed out: {timeout_err}")
+            raise
+        except httpx.ConnectError as conn_err:
+            self._report_error(conn_err, full_url, f"[Connection Error] Failed to connect to {full_url}: {conn_err}")
+            raise
+        except httpx.HTTPError as req_err:
+            self._report_error(req_err, full_url, f"[Request Error] An error occurred: {req_err}")
+            raise
+
+    async def log(self, level: str, message: str, **metadata):
+        """
+        Sends a single log entry to the (public) ingestion endpoint.
+        """
+        lvl = level.upper()
+        if _LEVELS.get(lvl, self.min_level_num) < self.min_level_num:
+            return
+
+        now_ms = time.time_ns() // 1_000_000 # UTC ms
+        payload = {
+            'service_name': self.service_name,
+            'level': lvl,
+            'message': message,
+            'timestamp': now_ms,
+            'metadata': {
+                **metadata,
+                'timestamp_iso': datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc).isoformat()
+            }
+        }
+
+        try:
+            await self._request(
+                'POST',
+                '/api/v1/logs/ingest',
+                auth=False,
+                json_payload=payload,
+                timeout=5
+            )
+        except Exception as e:
+            # Fallback to local print if service is unavailable
+            self._report_call_error(e, '/api/v1/logs/ingest', f"[LOG ERROR] {e}: {message}")
+
+    async def batch_log(self, logs: List[Dict[str, Any]]):
+        """
+        Sends multiple logs at once to the (public) batch ingestion endpoint.
+
+        Args:
+            logs (List[Dict]): A list of log dictionaries. Each dict
+                               should have 'level', 'message', 'metadata'.
+        """
+        # Loop invariants are hoisted out of the per-entry comprehension
+        svc = self.service_name
+        now_ms = time.time_ns() // 1_000_000 # UTC ms, shared by entries without one
+        processed_logs = [
+            {
+                'service_name': svc,
+                'level': log['level'] if log['level'].isupper() else log['level'].upper(),
+                'message': log['message'],
+                'timestamp': log['timestamp'] if 'timestamp' in log else now_ms,
+                'metadata': log.get('metadata') or {}
+            }
+            for log in logs
+        ]
+
+        await asyncio.gather(*(
+            self._send_chunk(processed_logs[start:start + _BATCH_CHUNK_SIZE])
+            for start in range(0, len(processed_logs), _BATCH_CHUNK_SIZE)
+        ))
+
+    async def _send_chunk(self, chunk: List[Dict[str, Any]]):
+        """
+        Posts one chunk of already-built log entries to the batch endpoint.
+        """
+        payload = {'logs': chunk}
+
+        try:
+            await self._request(
+                'POST',
+                '/api/v1/logs/ingest/batch',
+                auth=False,
+                json_payload=payload,
+                timeout=10
+            )
+        except Exception as e:
+            self._report_call_error(e, '/api/v1/logs/ingest/batch', f"[BATCH LOG ERROR] {e}")
+
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Returns True if an entry at `level` would be sent. Use it to skip
+        building expensive metadata for filtered-out levels.
+        """
+        return _LEVELS.get(level.upper(), self.min_level_num) >= self.min_level_num
+
+    # --- Convenience Methods ---
+
+    async def info(self, message: str, **metadata):
+        """Logs an INFO level message."""
+        await self.log('INFO', message, **metadata)
+
+    async def error(self, message: str, **metadata):
+        """Logs an ERROR level message."""
+        await self.log('ERROR', message, **metadata)
+
+    async def warning(self, message: str, **metadata):
+        """Logs a WARN level message."""
+        await self.log('WARN', message, **metadata)
+
+    async def debug(self, message: str, **metadata):
+        """Logs a DEBUG level message."""
+        await self.log('DEBUG', message, **metadata)
+
+    # --- Secure Endpoints ---
+
+    async def search_logs(
+        self,
+        service: Optional[str] = None,
+        level: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        limit: int = 100,
+        offset: Optional[int] = None,
+        query: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Searches logs from the main logging service.
+        See `CloudflareLogger.search_logs` for the arguments.
+        """
+        clean_params = _search_params(service, level, start_time, end_time, limit, offset, query)
+
+        try:
+            response = await self._request(
+                'GET',
+                '/api/v1/logs/search',
+                auth=True,
+                params=clean_params
+            )
+            return orjson.loads(response.content)
+        except Exception as e:
+            self._report_call_error(e, '/api/v1/logs/search', f"[SEARCH ERROR] {e}")
+            return {'logs': [], 'error': str(e)}
+
+    async def analyze_logs(
+        self,
+        service: Optional[str] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        search_keywords: Optional[str] = None
+    ) -> str:
+        """
+        Performs AI analysis by calling the log service's built-in AI endpoint.
+        See `CloudflareLogger.analyze_logs` for the arguments.
+        """
+        payload = {
+            'service_name': service,
+            'start_time': start_time,
+            'end_time': end_time,
+            'search_keywords': search_keywords
+        }
+
+        try:
+            response = await self._request(
+                'POST',
+                '/api/v1/ai-analysis',
+                auth=True,
                 json_payload=payload
             )
-            result = response.json()
+            result = orjson.loads(response.content)
             return result.get('analysis', 'No analysis content returned.')
         except Exception as e:
-            print(f"[ANALYSIS ERROR] {e}")
+            self._report_call_error(e, '/api/v1/ai-analysis', f"[ANALYSIS ERROR] {e}")
             return f"Analysis failed: {e}"
 
 # --- Usage Example ---
@@ -310,6 +1029,7 @@ if __name__ == "__main__":
         {'level': 'DEBUG', 'message': 'Processed item 456', 'metadata': {'item_id': 456}}
     ]
     logger.batch_log(log_batch)
+    logger.flush()
     print("Logs sent.")
 
     print("\n--- Searching Logs (Auth Key Sent) ---")
@@ -16,15 +16,67 @@ Categories:
 """
 
 import argparse
-import json
+import asyncio
+import bisect
+import heapq
+import operator
 import os
 import sys
-from datetime import datetime, timedelta
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional, Set
-import requests
+import aiohttp
+import httpx
+import orjson
 from dataclasses import dataclass
 
 
+# Score tables for score_repository. For "at least" rules the points are
+# looked up with bisect_right (value >= threshold moves up a bracket); for
+# "at most" rules with bisect_left (value <= threshold stays in the bracket).
+STAR_THRESHOLDS = [100, 500, 1000, 5000, 10000]
+STAR_POINTS = [5, 10, 15, 20, 25, 30]
+
+FORK_THRESHOLDS = [50, 100, 500, 1000]
+FORK_POINTS = [3, 6, 9, 12, 15]
+
+UPDATE_DAYS_THRESHOLDS = [7, 30, 90, 180]
+UPDATE_DAYS_POINTS = [20, 15, 10, 5, 0]
+
+OPEN_ISSUES_THRESHOLDS = [10, 50, 100]
+OPEN_ISSUES_POINTS = [10, 7, 5, 2]
+
+# Most points a repository can get from everything except its star count
+# (activity, forks, issues, description, topics, license and homepage)
+MAX_NON_STAR_POINTS = UPDATE_DAYS_POINTS[0] + FORK_POINTS[-1] + OPEN_ISSUES_POINTS[0] + 20
+
+# GitHub search fields copied into each results row: (output key, search
+# result key, default when the search result lacks the key)
+RESULT_FIELDS = (
+    ('name', 'full_name', ''),
+    ('url', 'html_url', ''),
+    ('description', 'description', ''),
+    ('stars', 'stargazers_count', 0),
+    ('forks', 'forks_count', 0),
+    ('language', 'language', ''),
+    ('topics', 'topics', []),
+    ('updated_at', 'updated_at', ''),
+)
+RESULT_KEYS = tuple(field[0] for field in RESULT_FIELDS)
+_get_result_fields = operator.itemgetter(*(field[1] for field in RESULT_FIELDS))
+
+# GitHub search pagination: 100 is the API maximum page size. Each extra
+# page costs another request against the 30/min search quota, so by default
+# every search is a single request.
+SEARCH_PER_PAGE = 100
+SEARCH_MAX_PAGES = 1
+
+# Times a search page is retried after GitHub rejects it for rate limiting
+# (the search API allows 30 requests per minute)
+SEARCH_RATE_LIMIT_RETRIES = 3
+
+
 @dataclass
 class SearchCategory:
     """Defines a search category for repository discovery"""
@@ -39,6 +91,15 @@ class SearchCategory:
 class RepositoryDiscovery:
     """Manages repository discovery and recommendation"""
 
+    # Criteria the Cloudflare Worker ranks repositories by
+    AGENTIC_CRITERIA = [
+        'innovation',
+        'code_quality',
+        'community_activity',
+        'practical_utility',
+        'documentation'
+    ]
+
     # Define search categories
     CATEGORIES = {
         'cloudflare-worker-agentic': SearchCategory(
@@ -143,53 +204,128 @@ class RepositoryDiscovery:
         self,
         github_token: str,
         cloudflare_endpoint: Optional[str] = None,
-        state_file: str = '.github/discovery-state/processed-repos.json'
+        state_file: str = '.github/discovery-state/processed-repos.json',
+        batch_analysis: bool = False,
+        search_pages: int = SEARCH_MAX_PAGES
     ):
         self.github_token = github_token
         self.cloudflare_endpoint = cloudflare_endpoint
+        # Send all categories to the Worker in one request; only for Workers
+        # that understand the batched contract
+        self.batch_analysis = batch_analysis
+        # Most result pages fetched per search (see _fetch_search_results)
+        self.search_pages = search_pages
         self.state_file = state_file
         self.processed_repos: Set[str] = set()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'token {github_token}',
-            'Accept': 'application/vnd.github.v3+json'
-        })
+        # Repositories processed during this run; save_state appends only these
+        self.new_processed_repos: Set[str] = set()
+        # Set when the state file is in the legacy single-document format and
+        # must be rewritten in full once
+        self.rewrite_state = False
+
+        # GitHub session and search concurrency limit, set up per run
+        # by run_discovery()
+        self.github_session: Optional[aiohttp.ClientSession] = None
+        self.search_semaphore: Optional[asyncio.Semaphore] = None
+        self.search_tasks: Dict[tuple, asyncio.Task] = {}
+        # Epoch time before which no search may be sent, set from GitHub's
+        # rate limit headers once the search quota is used up
+        self.search_resume_at = 0.0
+
+        # HTTP/2 client for the Cloudflare Worker, set up per run by
+        # run_discovery(); concurrent analysis calls share one connection
+        self.cf_client: Optional[httpx.AsyncClient] = None
 
         # Load processed repositories
         self.load_state()
 
     def load_state(self):
-        """Load previously processed repositories"""
+        """
+        Load previously processed repositories.
+
+        The state file is append-only NDJSON, one {"url", "added"} record per
+        line. The legacy {"processed_repos": [...]} document is still read,
+        and is converted on the next save.
+        """
         if os.path.exists(self.state_file):
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
-                self.processed_repos = set(data.get('processed_repos', []))
-                print(f"Loaded {len(self.processed_repos)} processed repositories")
+            with open(self.state_file, 'rb') as f:
+                raw = f.read()
+
+            try:
+                legacy = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                legacy = None
+
+            if isinstance(legacy, dict) and 'processed_repos' in legacy:
+                self.processed_repos = set(legacy['processed_repos'])
+                self.rewrite_state = True
+            else:
+                self.processed_repos = {
+                    orjson.loads(line)['url']
+                    for line in raw.splitlines()
+                    if line.strip()
+                }
+            print(f"Loaded {len(self.processed_repos)} processed repositories")
         else:
             print("No previous state found, starting fresh")
 
     def save_state(self):
-        """Save processed repositories state"""
+        """Save processed repositories state, appending only this run's additions"""
         os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
 
-        data = {
-            'processed_repos': list(self.processed_repos),
-            'last_updated': datetime.now(timezone.utc).isoformat()
-        }
+        added = datetime.now(timezone.utc).isoformat()
+        if self.rewrite_state:
+            urls, mode = self.processed_repos, 'wb'
+        else:
+            urls, mode = self.new_processed_repos, 'ab'
+
+        with open(self.state_file, mode) as f:
+            f.write(b''.join(
+                orjson.dumps({'url': url, 'added': added}) + b'\n'
+                for url in sorted(urls)
+            ))
 
-        with open(self.state_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.rewrite_state = False
+        self.new_processed_repos.clear()
 
         print(f"Saved state: {len(self.processed_repos)} processed repositories")
 
-    def search_github(
+    async def search_github(
         self,
         query: str,
         min_stars: int = 50,
         max_age_days: int = 365,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        top_n: int = 5
     ) -> List[Dict[str, Any]]:
-        """Search GitHub repositories"""
+        """
+        Search GitHub repositories.
+
+        Fetches one page of 100 results by default; with more search_pages,
+        paging stops once no later page could change the top_n
+        best-scoring new repositories. Identical searches within a run share
+        one request; each caller gets its own copies of the result dicts,
+        since they are annotated later.
+        """
+        key = (query, min_stars, max_age_days, language, top_n)
+        task = self.search_tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_search_results(query, min_stars, max_age_days, language, top_n)
+            )
+            self.search_tasks[key] = task
+
+        return [dict(repo) for repo in await task]
+
+    async def _fetch_search_results(
+        self,
+        query: str,
+        min_stars: int,
+        max_age_days: int,
+        language: Optional[str],
+        top_n: int
+    ) -> List[Dict[str, Any]]:
+        """Run one GitHub repository search, fetching as many pages as needed"""
 
         # Build search query
         created_date = (datetime.utcnow() - timedelta(days=max_age_days)).strftime('%Y-%m-%d')
@@ -198,28 +334,95 @@ class RepositoryDiscovery:
         if language:
             search_query += f" language:{language}"
 
-        params = {
-            'q': search_query,
-            'sort': 'stars',
-            'order': 'desc',
-            'per_page': 20
-        }
-
-        try:
-            response = self.session.get(
-                'https://api.github.com/search/repositories',
-                params=params
-            )
-            response.raise_for_status()
+        items = []
+        top_scores = []  # min-heap of the best top_n scores seen so far
+        now = datetime.now(timezone.utc)
+
+        for page in range(1, self.search_pages + 1):
+            page_items = await self._fetch_search_page({
+                'q': search_query,
+                'sort': 'stars',
+                'order': 'desc',
+                'per_page': SEARCH_PER_PAGE,
+                'page': page
+            })
+            items.extend(page_items)
+
+            if len(page_items) < SEARCH_PER_PAGE or page == self.search_pages:
+                break
+
+            for repo in page_items:
+                if repo.get('html_url') in self.processed_repos:
+                    continue
+                score = self.score_repository(repo, now)
+                if len(top_scores) < top_n:
+                    heapq.heappush(top_scores, score)
+                elif score > top_scores[0]:
+                    heapq.heapreplace(top_scores, score)
+
+            # Results come sorted by stars, so no repository on a later page
+            # can score above the last star count's bracket plus every other
+            # point; stop once that cannot beat the current top_n cutoff
+            if len(top_scores) == top_n:
+                last_stars = page_items[-1].get('stargazers_count', 0)
+                best_possible = STAR_POINTS[bisect.bisect_right(STAR_THRESHOLDS, last_stars)] + MAX_NON_STAR_POINTS
+                if best_possible <= top_scores[0]:
+                    break
+
+        return items
+
+    async def _fetch_search_page(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run one GitHub repository search request"""
+
+        for attempt in range(SEARCH_RATE_LIMIT_RETRIES + 1):
+            try:
+                async with self.search_semaphore:
+                    # Hold off while the search quota is used up
+                    delay = self.search_resume_at - time.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                    async with self.github_session.get(
+                        'https://api.github.com/search/repositories',
+                        params=params
+                    ) as response:
+                        delay = self.rate_limit_delay(response.headers)
+                        if delay is not None:
+                            self.search_resume_at = max(self.search_resume_at, time.time() + delay)
+                            if response.status in (403, 429) and attempt < SEARCH_RATE_LIMIT_RETRIES:
+                                print(f"GitHub search rate limited, retrying in {delay:.0f}s: {params['q']}")
+                                continue
+
+                        response.raise_for_status()
+
+                        data = await response.json()
+                        return data.get('items', [])
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Error searching GitHub ({params['q']}): {e}")
+                return []
+
+        return []
+
+    @staticmethod
+    def rate_limit_delay(headers) -> Optional[float]:
+        """
+        Seconds to wait before the next search when GitHub's response
+        headers say the quota is used up (Retry-After, or no remaining
+        requests until X-RateLimit-Reset); None otherwise.
+        """
+        retry_after = headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after)
 
-            data = response.json()
-            return data.get('items', [])
+        reset = headers.get('X-RateLimit-Reset', '')
+        if headers.get('X-RateLimit-Remaining') == '0' and reset.isdigit():
+            # One second of slack for clock skew
+            return max(int(reset) - time.time(), 0) + 1
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error searching GitHub: {e}")
-            return []
+        return None
 
-    def get_agentic_analysis(self, repositories: List[Dict[str, Any]], category: str) -> Dict[str, Any]:
+    async def get_agentic_analysis(self, repositories: List[Dict[str, Any]], category: str) -> Dict[str, Any]:
         """Get AI-powered analysis of repositories using Cloudflare Worker"""
 
         if not self.cloudflare_endpoint:
@@ -231,20 +434,12 @@ class RepositoryDiscovery:
                 'repositories': repositories,
                 'category': category,
                 'task': 'analyze_and_rank',
-                'criteria': [
-                    'innovation',
-                    'code_quality',
-                    'community_activity',
-                    'practical_utility',
-                    'documentation'
-                ]
+                'criteria': self.AGENTIC_CRITERIA
             }
 
-            response = requests.post(
+            response = await self.cf_client.post(
                 self.cloudflare_endpoint,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
+                json=payload
             )
 
             if response.status_code == 200:
@@ -253,81 +448,145 @@ class RepositoryDiscovery:
                 print(f"Cloudflare API returned status {response.status_code}")
                 return {}
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
             print(f"Error calling Cloudflare Worker: {e}")
             return {}
 
-    def score_repository(self, repo: Dict[str, Any]) -> float:
+    async def get_agentic_analysis_batch(
+        self,
+        recommendations_by_category: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get AI-powered analysis for every category, keyed by category name.
+
+        Categories are analyzed with concurrent get_agentic_analysis calls.
+        With batch_analysis set, a single batched Worker call is tried first,
+        falling back to the per-category calls if it fails. Categories with
+        fewer than two recommendations are skipped, since ranking a single
+        repository tells us nothing.
+        """
+
+        if not self.cloudflare_endpoint:
+            print("Cloudflare endpoint not configured, skipping agentic analysis")
+            return {}
+
+        batches = {name: repos for name, repos in recommendations_by_category.items() if len(repos) >= 2}
+        if not batches:
+            return {}
+
+        if self.batch_analysis:
+            results = await self._fetch_agentic_analysis_batch(batches)
+            if results is not None:
+                return results
+
+        # One category's failure only costs that category its analysis
+        analyses = await asyncio.gather(*(
+            self.get_agentic_analysis(repos, name) for name, repos in batches.items()
+        ), return_exceptions=True)
+
+        results = {}
+        for name, analysis in zip(batches, analyses):
+            if isinstance(analysis, Exception):
+                print(f"\nError analyzing category {name}: {analysis}")
+                analysis = {}
+            elif isinstance(analysis, BaseException):
+                raise analysis
+            results[name] = analysis
+        return results
+
+    async def _fetch_agentic_analysis_batch(
+        self,
+        batches: Dict[str, List[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Send one batched analysis request to the Cloudflare Worker.
+        Returns None if the Worker failed or did not answer with batched
+        results.
+        """
+
+        try:
+            payload = {
+                'batches': batches,
+                'task': 'analyze_and_rank',
+                'criteria': self.AGENTIC_CRITERIA
+            }
+
+            # The Worker fans out over every category, so allow more time
+            response = await self.cf_client.post(
+                self.cloudflare_endpoint,
+                json=payload,
+                timeout=60.0
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                if isinstance(data, dict) and isinstance(data.get('results'), dict):
+                    return data['results']
+
+            print(f"Cloudflare API returned no batched results (status {response.status_code}), analyzing per category")
+
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Error calling Cloudflare Worker for batched analysis, analyzing per category: {e}")
+
+        return None
+
+    def apply_agentic_rankings(
+        self,
+        recommendations: List[Dict[str, Any]],
+        agentic_results: Dict[str, Any]
+    ):
+        """Enhance recommendations with agentic insights"""
+        if agentic_results and 'rankings' in agentic_results:
+            rankings = {r['url']: r for r in agentic_results.get('rankings', [])}
+
+            for repo in recommendations:
+                url = repo.get('html_url', '')
+                if url in rankings:
+                    repo['agentic_score'] = rankings[url].get('score', 0)
+                    repo['reasoning'] = rankings[url].get('reasoning', '')
+
+    def score_repository(self, repo: Dict[str, Any], now: Optional[datetime] = None) -> float:
         """
         Score a repository based on various metrics.
         Returns a score between 0 and 100.
+
+        Pass ``now`` (timezone-aware UTC) when scoring many repositories so
+        the current time is only taken once.
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
         score = 0.0
 
         # Star count (max 30 points)
         stars = repo.get('stargazers_count', 0)
-        if stars >= 10000:
-            score += 30
-        elif stars >= 5000:
-            score += 25
-        elif stars >= 1000:
-            score += 20
-        elif stars >= 500:
-            score += 15
-        elif stars >= 100:
-            score += 10
-        else:
-            score += 5
+        score += STAR_POINTS[bisect.bisect_right(STAR_THRESHOLDS, stars)]
 
         # Recent activity (max 20 points)
         updated_at = repo.get('updated_at', '')
         if updated_at:
             try:
                 updated = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                days_since_update = (datetime.utcnow().replace(tzinfo=updated.tzinfo) - updated).days
-
-                if days_since_update <= 7:
-                    score += 20
-                elif days_since_update <= 30:
-                    score += 15
-                elif days_since_update <= 90:
-                    score += 10
-                elif days_since_update <= 180:
-                    score += 5
+                days_since_update = (now - updated).days
+                score += UPDATE_DAYS_POINTS[bisect.bisect_left(UPDATE_DAYS_THRESHOLDS, days_since_update)]
             except ValueError:
                 pass
 
         # Fork count (max 15 points)
         forks = repo.get('forks_count', 0)
-        if forks >= 1000:
-            score += 15
-        elif forks >= 500:
-            score += 12
-        elif forks >= 100:
-            score += 9
-        elif forks >= 50:
-            score += 6
-        else:
-            score += 3
+        score += FORK_POINTS[bisect.bisect_right(FORK_THRESHOLDS, forks)]
 
         # Has description (5 points)
         if repo.get('description'):
             score += 5
 
         # Has topics (5 points)
-        if repo.get('topics') and len(repo.get('topics', [])) > 0:
+        if repo.get('topics'):
             score += 5
 
         # Open issues (max 10 points - fewer is better for maintenance)
         open_issues = repo.get('open_issues_count', 0)
-        if open_issues <= 10:
-            score += 10
-        elif open_issues <= 50:
-            score += 7
-        elif open_issues <= 100:
-            score += 5
-        else:
-            score += 2
+        score += OPEN_ISSUES_POINTS[bisect.bisect_left(OPEN_ISSUES_THRESHOLDS, open_issues)]
 
         # Has license (5 points)
         if repo.get('license'):
@@ -339,19 +598,7 @@ class RepositoryDiscovery:
 
         return score
 
-    def filter_new_repositories(self, repositories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter out repositories that have been processed before"""
-        new_repos = []
-
-        for repo in repositories:
-            repo_url = repo.get('html_url', '')
-            if repo_url and repo_url not in self.processed_repos:
-                new_repos.append(repo)
-
-        print(f"Found {len(new_repos)} new repositories out of {len(repositories)} total")
-        return new_repos
-
-    def discover_category(
+    async def discover_category(
         self,
         category_key: str,
         category: SearchCategory
@@ -365,73 +612,133 @@ class RepositoryDiscovery:
         all_repos = []
         seen_urls = set()
 
-        # Search with each keyword
+        # Search with each keyword and language concurrently; the semaphore
+        # keeps the number of in-flight GitHub requests bounded
+        tasks = []
         for keyword in category.keywords:
             print(f"\nSearching: {keyword}")
 
             for language in category.filters.get('language', [None]):
-                repos = self.search_github(
+                tasks.append(asyncio.create_task(self.search_github(
                     query=keyword,
                     min_stars=category.min_stars,
                     max_age_days=category.max_age_days,
-                    language=language
-                )
+                    language=language,
+                    top_n=category.recommendation_count
+                )))
 
-                # Deduplicate
-                for repo in repos:
-                    url = repo.get('html_url', '')
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        all_repos.append(repo)
-
-        print(f"\nTotal repositories found: {len(all_repos)}")
-
-        # Filter out previously processed repos
-        new_repos = self.filter_new_repositories(all_repos)
-
-        if not new_repos:
-            print("No new repositories to recommend")
+        # Deduplicate, in the same keyword/language order as the searches
+        for repos in await asyncio.gather(*tasks):
+            for repo in repos:
+                url = repo.get('html_url', '')
+                if url and url not in seen_urls:
+                    seen_urls.add(url)
+                    all_repos.append(repo)
+
+        print(f"\n[{category.name}] Total repositories found: {len(all_repos)}")
+
+        # Filter out previously processed repos and score the rest in one pass
+        now = datetime.now(timezone.utc)
+        candidates = [
+            (self.score_repository(repo, now), repo)
+            for repo in all_repos
+            if repo['html_url'] not in self.processed_repos
+        ]
+        print(f"[{category.name}] Found {len(candidates)} new repositories out of {len(all_repos)} total")
+
+        if not candidates:
+            print(f"[{category.name}] No new repositories to recommend")
             return []
 
-        # Score repositories
-        for repo in new_repos:
-            repo['discovery_score'] = self.score_repository(repo)
+        # Sort by score and keep the top N recommendations
+        candidates.sort(key=lambda c: c[0], reverse=True)
+        recommendations = []
+        for score, repo in candidates[:category.recommendation_count]:
+            repo['discovery_score'] = score
+            recommendations.append(repo)
 
-        # Sort by score
-        new_repos.sort(key=lambda r: r['discovery_score'], reverse=True)
+        # Mark as processed
+        for repo in recommendations:
+            self.processed_repos.add(repo['html_url'])
+            self.new_processed_repos.add(repo['html_url'])
 
-        # Get top N recommendations
-        recommendations = new_repos[:category.recommendation_count]
+        print(f"\n[{category.name}] Recommending {len(recommendations)} repositories")
+        for i, repo in enumerate(recommendations, 1):
+            print(f"  {i}. {repo['full_name']} ({repo['stargazers_count']} stars, score: {repo['discovery_score']:.1f})")
 
-        # Get agentic analysis if available
-        agentic_results = self.get_agentic_analysis(recommendations, category.name)
+        return recommendations
 
-        # Enhance recommendations with agentic insights
-        if agentic_results and 'rankings' in agentic_results:
-            rankings = {r['url']: r for r in agentic_results.get('rankings', [])}
+    async def prewarm_github_connection(self):
+        """
+        Open a GitHub connection (DNS, TCP and TLS) before the searches start,
+        so the first search reuses it. Failures are ignored; the searches
+        will simply connect themselves.
+        """
+        try:
+            async with self.github_session.head(
+                'https://api.github.com',
+                timeout=aiohttp.ClientTimeout(total=5)
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
 
-            for repo in recommendations:
-                url = repo.get('html_url', '')
-                if url in rankings:
-                    repo['agentic_score'] = rankings[url].get('score', 0)
-                    repo['reasoning'] = rankings[url].get('reasoning', '')
+    def format_recommendation(self, repo: Dict[str, Any]) -> Dict[str, Any]:
+        """Project a scored GitHub repository onto the results file schema"""
+        try:
+            row = dict(zip(RESULT_KEYS, _get_result_fields(repo)))
+        except KeyError:
+            row = {key: repo.get(source, default) for key, source, default in RESULT_FIELDS}
+
+        license_info = repo.get('license')
+        row['license'] = license_info.get('name', '') if license_info else ''
+        row['homepage'] = repo.get('homepage', '')
+        row['discovery_score'] = repo.get('discovery_score', 0)
+        row['agentic_score'] = repo.get('agentic_score')
+        row['reasoning'] = repo.get('reasoning', '')
+        return row
+
+    async def discover_and_record(
+        self,
+        category_key: str,
+        category: SearchCategory,
+        partial_file: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Discover one category and append its recommendations to the partial
+        results file as soon as it finishes. Returns None if the category
+        failed.
+        """
+        try:
+            recommendations = await self.discover_category(category_key, category)
 
-        # Mark as processed
-        for repo in recommendations:
-            self.processed_repos.add(repo.get('html_url', ''))
+        except Exception as e:
+            print(f"\nError processing category {category_key}: {e}")
+            traceback.print_exc()
+            return None
 
-        print(f"\nRecommending {len(recommendations)} repositories")
-        for i, repo in enumerate(recommendations, 1):
-            print(f"  {i}. {repo['full_name']} ({repo['stargazers_count']} stars, score: {repo['discovery_score']:.1f})")
+        with open(partial_file, 'ab') as f:
+            f.write(orjson.dumps({
+                'category': category.name,
+                'recommendations': [self.format_recommendation(repo) for repo in recommendations]
+            }) + b'\n')
 
         return recommendations
 
-    def run_discovery(
+    async def run_discovery(
         self,
         categories: Optional[List[str]] = None,
         output_file: str = 'discovery-results.json'
     ) -> Dict[str, Any]:
-        """Run discovery for all or specified categories"""
+        """
+        Run discovery for all or specified categories.
+
+        Each category's recommendations are appended to a
+        ``<output>.partial.ndjson`` file as soon as they are found, so a run
+        that dies before the final results file is written still leaves the
+        completed categories on disk. The partial file is removed once the
+        results file is saved.
+        """
 
         print("\n" + "="*60)
         print("Repository Discovery")
@@ -456,44 +763,69 @@ class RepositoryDiscovery:
             'total_recommendations': 0
         }
 
-        # Discover for each category
-        for category_key, category in search_categories.items():
-            try:
-                recommendations = self.discover_category(category_key, category)
-
-                results['recommendations'][category.name] = [
-                    {
-                        'name': repo['full_name'],
-                        'url': repo['html_url'],
-                        'description': repo.get('description', ''),
-                        'stars': repo.get('stargazers_count', 0),
-                        'forks': repo.get('forks_count', 0),
-                        'language': repo.get('language', ''),
-                        'topics': repo.get('topics', []),
-                        'updated_at': repo.get('updated_at', ''),
-                        'license': repo.get('license', {}).get('name', '') if repo.get('license') else '',
-                        'homepage': repo.get('homepage', ''),
-                        'discovery_score': repo.get('discovery_score', 0),
-                        'agentic_score': repo.get('agentic_score'),
-                        'reasoning': repo.get('reasoning', '')
-                    }
-                    for repo in recommendations
-                ]
-
-                results['total_recommendations'] += len(recommendations)
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        partial_file = os.path.splitext(output_file)[0] + '.partial.ndjson'
+        with open(partial_file, 'wb') as f:
+            f.write(orjson.dumps({
+                'timestamp': results['timestamp'],
+                'categories': results['categories_searched']
+            }) + b'\n')
+
+        # One pooled GitHub session and one Worker client for the whole run
+        self.search_semaphore = asyncio.Semaphore(10)
+        self.search_tasks = {}
+        self.search_resume_at = 0.0
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                'Authorization': f'token {self.github_token}',
+                'Accept': 'application/vnd.github.v3+json'
+            }
+        ) as self.github_session, httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            timeout=30.0,
+            headers={'Content-Type': 'application/json'}
+        ) as self.cf_client:
+            await self.prewarm_github_connection()
+
+            # Discover all categories concurrently; the search semaphore still
+            # bounds GitHub traffic, and one failing category doesn't stop the rest
+            outcomes = await asyncio.gather(*(
+                self.discover_and_record(key, category, partial_file)
+                for key, category in search_categories.items()
+            ))
+
+            category_recommendations: Dict[str, List[Dict[str, Any]]] = {
+                category.name: recommendations
+                for category, recommendations in zip(search_categories.values(), outcomes)
+                if recommendations is not None
+            }
+
+            # Get agentic analysis for all categories at once, if available
+            agentic_results = await self.get_agentic_analysis_batch(category_recommendations)
 
+        for category_name, recommendations in category_recommendations.items():
+            try:
+                self.apply_agentic_rankings(recommendations, agentic_results.get(category_name, {}))
             except Exception as e:
-                print(f"\nError processing category {category_key}: {e}")
-                import traceback
+                print(f"\nError applying agentic rankings for {category_name}: {e}")
                 traceback.print_exc()
 
+            results['recommendations'][category_name] = [
+                self.format_recommendation(repo) for repo in recommendations
+            ]
+
+            results['total_recommendations'] += len(recommendations)
+
         # Save state
         self.save_state()
 
         # Save results
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        os.remove(partial_file)
 
         print("\n" + "="*60)
         print(f"Discovery complete!")
@@ -527,6 +859,17 @@ def main():
         default='.github/discovery-state/processed-repos.json',
         help='State file to track processed repositories'
     )
+    parser.add_argument(
+        '--batch-analysis',
+        action='store_true',
+        help='Send all categories to the Cloudflare Worker in one request (Worker must support batches)'
+    )
+    parser.add_argument(
+        '--search-pages',
+        type=int,
+        default=SEARCH_MAX_PAGES,
+        help='Most result pages (of 100) to fetch per search; each page counts against the 30/min search quota'
+    )
     parser.add_argument(
         '--categories',
         help='Comma-separated list of categories to search'
@@ -549,15 +892,17 @@ def main():
     discovery = RepositoryDiscovery(
         github_token=github_token,
         cloudflare_endpoint=args.cloudflare_endpoint,
-        state_file=args.state_file
+        state_file=args.state_file,
+        batch_analysis=args.batch_analysis,
+        search_pages=args.search_pages
     )
 
     # Run discovery
     try:
-        results = discovery.run_discovery(
+        results = asyncio.run(discovery.run_discovery(
             categories=categories,
             output_file=args.output
-        )
+        ))
 
         sys.exit(0)
 
@@ -13,13 +13,35 @@ This script:
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+import httpx
+import orjson
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # libyaml-backed loader, much faster on large catalogs
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Sync operations are POSTed to the Worker in chunks of at most this many,
+# with up to SYNC_MAX_CONCURRENT_CHUNKS requests in flight
+SYNC_CHUNK_SIZE = 200
+SYNC_MAX_CONCURRENT_CHUNKS = 4
+
+
+def _assistant_key(assistant: Dict[str, Any]) -> Optional[str]:
+    """Lookup key for an assistant: its name, or its id if it has no name"""
+    return assistant.get('name') or assistant.get('id')
 
 
 class AssistantSyncManager:
@@ -28,20 +50,28 @@ class AssistantSyncManager:
     def __init__(self, cloudflare_endpoint: str, api_token: Optional[str] = None):
         self.cloudflare_endpoint = cloudflare_endpoint
         self.api_token = api_token or os.environ.get('CLOUDFLARE_API_TOKEN')
+        self.auth_headers = {}
         self.session = requests.Session()
+        # Retry transient Worker failures when fetching current assistants
+        self.session.mount('https://', HTTPAdapter(max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504]
+        )))
 
         if self.api_token:
-            self.session.headers.update({
+            self.auth_headers = {
                 'Authorization': f'Bearer {self.api_token}',
                 'Content-Type': 'application/json'
-            })
+            }
+            self.session.headers.update(self.auth_headers)
 
     def load_yaml_assistants(self, file_path: str) -> List[Dict[str, Any]]:
         """Load assistants from YAML file"""
         print(f"Loading assistants from {file_path}...")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        with open(file_path, 'rb') as f:
+            data = yaml.load(f, Loader=SafeLoader)
 
         assistants = data.get('assistants', [])
         print(f"Loaded {len(assistants)} assistants from YAML")
@@ -67,17 +97,26 @@ class AssistantSyncManager:
             print("Assuming no existing assistants (first sync)")
             return []
 
-    def compute_assistant_hash(self, assistant: Dict[str, Any]) -> str:
+    def compute_assistant_hash(self, assistant: Dict[str, Any]) -> bytes:
         """
         Compute a hash/fingerprint of an assistant for change detection.
         This uses key fields that would indicate a meaningful change.
         """
-        # Create a normalized representation for comparison
-        key_fields = ['name', 'description', 'url', 'category', 'tags', 'author']
-        normalized = {k: assistant.get(k) for k in key_fields if k in assistant}
-
-        # Convert to stable JSON string for hashing
-        return json.dumps(normalized, sort_keys=True)
+        # Feed each present key field into a 16-byte BLAKE2b digest instead
+        # of building a full JSON string; the NUL separators keep field
+        # boundaries unambiguous (serialized JSON never contains a raw NUL)
+        digest = hashlib.blake2b(digest_size=16)
+        for k in ('name', 'description', 'url', 'category', 'tags', 'author'):
+            if k in assistant:
+                digest.update(k.encode())
+                digest.update(b'\x00')
+                digest.update(orjson.dumps(
+                    assistant[k],
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                ))
+                digest.update(b'\x00')
+
+        return digest.digest()
 
     def detect_changes(
         self,
@@ -92,47 +131,34 @@ class AssistantSyncManager:
         """
         print("\nDetecting changes...")
 
-        # Create lookup maps
-        # Use name or unique identifier as key
-        yaml_map = {}
-        for assistant in yaml_assistants:
-            key = assistant.get('name') or assistant.get('id')
-            if key:
-                yaml_map[key] = assistant
-
-        current_map = {}
-        for assistant in current_assistants:
-            # Only consider active assistants
-            if assistant.get('isActive', True) and not assistant.get('dateDeleted'):
-                key = assistant.get('name') or assistant.get('id')
-                if key:
-                    current_map[key] = assistant
-
-        # Detect new, updated, and unchanged
-        new_assistants = []
+        # Create lookup maps keyed by name or unique identifier; only
+        # active assistants count on the Cloudflare side
+        yaml_map = {key: a for a in yaml_assistants if (key := _assistant_key(a))}
+        current_map = {
+            key: a for a in current_assistants
+            if a.get('isActive', True) and not a.get('dateDeleted') and (key := _assistant_key(a))
+        }
+
+        # Detect new and deleted by key, keeping the YAML / Worker order
+        new_assistants = [a for key, a in yaml_map.items() if key not in current_map]
+        deleted_assistants = [a for key, a in current_map.items() if key not in yaml_map]
+
+        # Detect updated and unchanged among the keys present on both sides
         updated_assistants = []
         unchanged_assistants = []
 
         for key, yaml_assistant in yaml_map.items():
-            if key not in current_map:
-                new_assistants.append(yaml_assistant)
+            current_assistant = current_map.get(key)
+            if current_assistant is None:
+                continue
+
+            if self.compute_assistant_hash(yaml_assistant) != self.compute_assistant_hash(current_assistant):
+                updated_assistants.append({
+                    'old': current_assistant,
+                    'new': yaml_assistant
+                })
             else:
-                yaml_hash = self.compute_assistant_hash(yaml_assistant)
-                current_hash = self.compute_assistant_hash(current_map[key])
-
-                if yaml_hash != current_hash:
-                    updated_assistants.append({
-                        'old': current_map[key],
-                        'new': yaml_assistant
-                    })
-                else:
-                    unchanged_assistants.append(yaml_assistant)
-
-        # Detect deleted
-        deleted_assistants = []
-        for key, current_assistant in current_map.items():
-            if key not in yaml_map:
-                deleted_assistants.append(current_assistant)
+                unchanged_assistants.append(yaml_assistant)
 
         print(f"  New: {len(new_assistants)}")
         print(f"  Updated: {len(updated_assistants)}")
@@ -146,6 +172,65 @@ class AssistantSyncManager:
             'unchanged': unchanged_assistants
         }
 
+    @staticmethod
+    def chunk_operation_groups(operation_groups: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Pack operation groups into chunks of at most SYNC_CHUNK_SIZE
+        operations. A group (e.g. an update's deactivate/insert pair) is
+        never split across chunks, so it succeeds or fails as a whole.
+        """
+        chunks = []
+        chunk = []
+        for group in operation_groups:
+            if chunk and len(chunk) + len(group) > SYNC_CHUNK_SIZE:
+                chunks.append(chunk)
+                chunk = []
+            chunk.extend(group)
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    async def post_operation_chunks(self, chunks: List[List[Dict[str, Any]]], timestamp: str) -> List[int]:
+        """
+        POST chunks of sync operations to the Worker, several at a time over
+        one HTTP/2 connection.
+
+        Returns:
+            Indexes of the chunks that failed
+        """
+        batch_total = len(chunks)
+        semaphore = asyncio.Semaphore(SYNC_MAX_CONCURRENT_CHUNKS)
+
+        async def send_chunk(client: httpx.AsyncClient, batch_index: int) -> bool:
+            payload = {
+                'operations': chunks[batch_index],
+                'source': 'awesome-assistants-sync',
+                'timestamp': timestamp,
+                'batch_index': batch_index,
+                'batch_total': batch_total
+            }
+
+            async with semaphore:
+                try:
+                    response = await client.post(f"{self.cloudflare_endpoint}/sync", json=payload)
+                    response.raise_for_status()
+                    result = response.json()
+
+                except (httpx.HTTPError, ValueError) as e:
+                    print(f"Error syncing batch {batch_index + 1}/{batch_total} to Cloudflare Worker: {e}")
+                    if isinstance(e, httpx.HTTPStatusError):
+                        print(f"Response: {e.response.text}")
+                    return False
+
+            print(f"Batch {batch_index + 1}/{batch_total} synced: {result}")
+            return True
+
+        async with httpx.AsyncClient(http2=True, headers=self.auth_headers, timeout=60.0) as client:
+            synced = await asyncio.gather(*(send_chunk(client, i) for i in range(batch_total)))
+
+        return [i for i, ok in enumerate(synced) if not ok]
+
     def sync_to_cloudflare(self, changes: Dict[str, List[Dict[str, Any]]], dry_run: bool = False) -> bool:
         """
         Sync changes to Cloudflare Worker.
@@ -160,19 +245,24 @@ class AssistantSyncManager:
         mode = "DRY RUN" if dry_run else "Syncing to Cloudflare Worker"
         print(f"\n{mode}...")
 
-        operations = []
+        # One timestamp for the whole sync, shared by every operation
+        now_iso = datetime.utcnow().isoformat()
+
+        # Operations that must be sent together are grouped, so chunking
+        # never separates them
+        operation_groups = []
 
         # Handle new assistants
         for assistant in changes['new']:
-            operations.append({
+            operation_groups.append([{
                 'action': 'insert',
                 'data': {
                     **assistant,
                     'isActive': True,
-                    'dateAdded': datetime.utcnow().isoformat(),
+                    'dateAdded': now_iso,
                     'version': 1
                 }
-            })
+            }])
             print(f"  [NEW] {assistant.get('name', 'Unknown')}")
 
         # Handle updated assistants
@@ -180,41 +270,44 @@ class AssistantSyncManager:
             old = update['old']
             new = update['new']
 
-            # Mark old version as inactive
-            operations.append({
-                'action': 'update',
-                'id': old.get('id'),
-                'data': {
-                    'isActive': False,
-                    'dateDeactivated': datetime.utcnow().isoformat()
-                }
-            })
-
-            # Insert new version
-            operations.append({
-                'action': 'insert',
-                'data': {
-                    **new,
-                    'isActive': True,
-                    'dateAdded': datetime.utcnow().isoformat(),
-                    'version': old.get('version', 0) + 1,
-                    'previousVersion': old.get('id')
+            operation_groups.append([
+                # Mark old version as inactive
+                {
+                    'action': 'update',
+                    'id': old.get('id'),
+                    'data': {
+                        'isActive': False,
+                        'dateDeactivated': now_iso
+                    }
+                },
+                # Insert new version
+                {
+                    'action': 'insert',
+                    'data': {
+                        **new,
+                        'isActive': True,
+                        'dateAdded': now_iso,
+                        'version': old.get('version', 0) + 1,
+                        'previousVersion': old.get('id')
+                    }
                 }
-            })
+            ])
             print(f"  [UPDATED] {new.get('name', 'Unknown')}")
 
         # Handle deleted assistants
         for assistant in changes['deleted']:
-            operations.append({
+            operation_groups.append([{
                 'action': 'update',
                 'id': assistant.get('id'),
                 'data': {
-                    'dateDeleted': datetime.utcnow().isoformat(),
+                    'dateDeleted': now_iso,
                     'isActive': False
                 }
-            })
+            }])
             print(f"  [DELETED] {assistant.get('name', 'Unknown')}")
 
+        operations = [op for group in operation_groups for op in group]
+
         if not operations:
             print("No changes to sync")
             return True
@@ -224,7 +317,7 @@ class AssistantSyncManager:
             payload = {
                 'operations': operations,
                 'source': 'awesome-assistants-sync',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': now_iso
             }
 
             print(f"\n[DRY RUN] Would send {len(operations)} operations to Cloudflare Worker:")
@@ -232,38 +325,32 @@ class AssistantSyncManager:
             print("\n[DRY RUN] No actual changes were made")
             return True
 
-        # Send batch update to Cloudflare Worker
-        try:
-            payload = {
-                'operations': operations,
-                'source': 'awesome-assistants-sync',
-                'timestamp': datetime.utcnow().isoformat()
-            }
+        # Send chunked batch updates to Cloudflare Worker
+        chunks = self.chunk_operation_groups(operation_groups)
+        batch_total = len(chunks)
 
-            print(f"\nSending {len(operations)} operations to Cloudflare Worker...")
+        print(f"\nSending {len(operations)} operations to Cloudflare Worker in {batch_total} batch(es)...")
 
-            response = self.session.post(
-                f"{self.cloudflare_endpoint}/sync",
-                json=payload
-            )
+        failed_batches = asyncio.run(self.post_operation_chunks(chunks, now_iso))
 
-            response.raise_for_status()
-            result = response.json()
-
-            print(f"Sync successful: {result}")
+        if not failed_batches:
+            print("Sync successful")
             return True
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error syncing to Cloudflare Worker: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Response: {e.response.text}")
-
-            # Save operations to file for manual review
-            with open('failed_sync_operations.json', 'w') as f:
-                json.dump(payload, f, indent=2)
-            print("Operations saved to failed_sync_operations.json")
+        # Save the failed chunks' operations to file for manual review, with
+        # their indexes so a retry only resubmits those
+        payload = {
+            'operations': [op for i in failed_batches for op in chunks[i]],
+            'source': 'awesome-assistants-sync',
+            'timestamp': now_iso,
+            'batch_total': batch_total,
+            'failed_batches': failed_batches
+        }
+        with open('failed_sync_operations.json', 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        print(f"{len(failed_batches)} of {batch_total} batch(es) failed; operations saved to failed_sync_operations.json")
 
-            return False
+        return False
 
     def run_sync(self, yaml_file: str, dry_run: bool = False) -> bool:
         """